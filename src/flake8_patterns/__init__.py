@@ -9,7 +9,6 @@ with direct references to authoritative Python performance books.
 
 from typing import Any
 
-from .book_refs import get_book_reference, get_book_stats, get_formatted_reference
 from .checker import PatternChecker
 from .messages import (
     ALL_MESSAGES,
@@ -20,6 +19,22 @@ from .messages import (
 )
 from .utils import PYTHON_313_PLUS, PYTHON_VERSION
 
+# book_refs is only needed by the educational helpers, not for linting;
+# defer it (PEP 562) so flake8 startup does not pay for its import.
+_LAZY_BOOK_REF_EXPORTS = frozenset(
+    {"get_book_reference", "get_book_stats", "get_formatted_reference"}
+)
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401 - PEP 562 returns arbitrary attrs
+    if name in _LAZY_BOOK_REF_EXPORTS:
+        from . import book_refs  # noqa: PLC0415 - deferred on purpose, see above
+
+        return getattr(book_refs, name)
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
+
+
 __version__ = "0.1.1"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
@@ -51,6 +66,8 @@ __all__ = [
 # Plugin information for flake8
 def get_plugin_info() -> dict[str, str | int]:
     """Get plugin information."""
+    from .book_refs import get_book_reference  # noqa: PLC0415 - deferred on purpose
+
     return {
         "name": "flake8-patterns",
         "version": __version__,
@@ -67,14 +84,23 @@ def get_plugin_info() -> dict[str, str | int]:
     }
 
 
-# Quick access to rule counts
+# Quick access to rule counts, bucketed in a single pass over the codes
+# (this module is imported on every flake8 invocation, so import-time
+# work is kept to one iteration instead of five).
+_counts = {"HP": 0, "PC": 0, "EFP": 0, "MC": 0, "NP": 0}
+for _code in ALL_MESSAGES:
+    _prefix = "EFP" if _code.startswith("EFP") else _code[:2]
+    if _prefix in _counts:
+        _counts[_prefix] += 1
+
 RULE_COUNTS = {
-    "string_operations": len([k for k in ALL_MESSAGES if k.startswith("HP")]),
-    "collection_performance": len([k for k in ALL_MESSAGES if k.startswith("PC")]),
-    "iteration_patterns": len([k for k in ALL_MESSAGES if k.startswith("EFP")]),
-    "memory_optimization": len([k for k in ALL_MESSAGES if k.startswith("MC")]),
-    "numpy_patterns": len([k for k in ALL_MESSAGES if k.startswith("NP")]),
+    "string_operations": _counts["HP"],
+    "collection_performance": _counts["PC"],
+    "iteration_patterns": _counts["EFP"],
+    "memory_optimization": _counts["MC"],
+    "numpy_patterns": _counts["NP"],
 }
+del _counts
 
 
 # Development utilities
@@ -93,6 +119,8 @@ def print_rule_summary() -> None:
 
 def print_book_coverage() -> None:
     """Print book reference coverage (useful for development)."""
+    from .book_refs import get_book_stats  # noqa: PLC0415 - deferred on purpose
+
     stats = get_book_stats()
 
     by_book = stats.get("by_book", {})
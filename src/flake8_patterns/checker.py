@@ -6,7 +6,7 @@ Follows the successful flake8-bugbear plugin architecture.
 """
 
 import ast
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from typing import Any
 
 from .messages import get_error_message
@@ -18,7 +18,7 @@ from .rules import (
     IterationPatternRules,
     StringPatternRules,
 )
-from .utils import NodeVisitorWithParents
+from .utils import NodeVisitorWithParents, attach_parents, child_nodes
 
 # Plugin metadata
 __version__ = "0.1.1"
@@ -26,6 +26,38 @@ __version__ = "0.1.1"
 # Error type: (line, column, message, type)
 Error = tuple[int, int, str, type[Any]]
 
+# Rule callback signature: (node, checker) -> None
+RuleCallback = Callable[[Any, "PatternChecker"], None]
+
+# Rendered error messages memoized per code: get_error_message rebuilds
+# the message/book-ref/impact f-string on every call otherwise.
+_MESSAGE_CACHE: dict[str, str] = {}
+
+
+def _rendered_message(code: str) -> str:
+    """Return the rendered message for a code, caching per process."""
+    message = _MESSAGE_CACHE.get(code)
+    if message is None:
+        message = _MESSAGE_CACHE[code] = get_error_message(code)
+    return message
+
+
+# Node types whose subtrees cannot contain anything the performance rules
+# inspect; traversal stops there instead of descending.
+_PERF_LEAF_TYPES = frozenset(
+    {
+        ast.Constant,
+        ast.Name,
+        ast.Import,
+        ast.ImportFrom,
+        ast.Pass,
+        ast.Break,
+        ast.Continue,
+        ast.Global,
+        ast.Nonlocal,
+    }
+)
+
 
 class PatternChecker(NodeVisitorWithParents):
     """Main checker class for Effective Python patterns.
@@ -45,12 +77,31 @@ class PatternChecker(NodeVisitorWithParents):
     name = "flake8-patterns"
     version = __version__
 
+    __slots__ = (
+        "_cls",
+        "_dispatch",
+        "_name_index",
+        "assignment_rules",
+        "comprehension_rules",
+        "dictionary_rules",
+        "errors",
+        "filename",
+        "function_rules",
+        "iteration_rules",
+        "string_rules",
+        "tree",
+    )
+
     def __init__(self, tree: ast.AST, filename: str = "(none)") -> None:
         """Initialize the checker with an AST tree."""
         super().__init__()
         self.tree = tree
         self.filename = filename
         self.errors: list[Error] = []
+        # Error tuples carry the checker class; resolve it once instead of
+        # calling type(self) per recorded error.
+        self._cls = type(self)
+        attach_parents(tree)
 
         # Initialize rule modules
         self.assignment_rules = AssignmentPatternRules()
@@ -60,13 +111,67 @@ class PatternChecker(NodeVisitorWithParents):
         self.function_rules = FunctionPatternRules()
         self.comprehension_rules = ComprehensionPatternRules()
 
+        # Dispatch registry: node type -> rule callbacks, built once so a
+        # single traversal serves every rule instead of one walk per rule.
+        # Only implemented rules are wired in; TODO stubs would otherwise
+        # cost one Python call per matching node while doing nothing.
+        # As rules land, re-register them here under the node type they
+        # inspect: EFP216/EFP429/EFP104/EFP108 on Assign, EFP318/EFP320/
+        # EFP317 on For, EFP321/EFP537/EFP538/EFP645 on FunctionDef,
+        # EFP426 on Try, EFP213 on List, EFP427/EFP12103 on Call, EFP531
+        # on Return, EFP748 on ClassDef, EFP215 on Subscript and EFP641
+        # on ListComp.
+        self._dispatch: dict[type, tuple[RuleCallback, ...]] = {
+            ast.Assign: (
+                # Tier 1 rules
+                self.assignment_rules.check_efp105_sequential_indexing,
+            ),
+        }
+
+        # Lazily built index of Name occurrences, keyed by identifier.
+        # Rules query it instead of re-walking statement subtrees.
+        self._name_index: dict[str, list[ast.Name]] | None = None
+
     def run(self) -> Generator[Error]:
-        """Run the checker and yield errors."""
+        """Run the checker and yield errors.
+
+        PatternChecker defines no visit_* specializations — all rule
+        work goes through the dispatch registry — so the traversal is an
+        explicit stack over iter_child_nodes instead of the recursive
+        visit() machinery: one dict probe per node, no per-node Python
+        frames. Children are pushed reversed to keep preorder source
+        order, so errors are emitted as before.
+        """
         self.errors = []
-        self.visit(self.tree)
+        get_callbacks = self._dispatch.get
+        children_of = child_nodes
+        stack = [self.tree]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            node = pop()
+            callbacks = get_callbacks(type(node))
+            if callbacks:
+                self._current = node
+                for callback in callbacks:
+                    callback(node, self)
+            children = children_of(node)
+            children.reverse()
+            extend(children)
 
         yield from self.errors
 
+    def name_occurrences(self, name: str) -> list[ast.Name]:
+        """Get all Name nodes for an identifier (indexed once per tree)."""
+        index = self._name_index
+        if index is None:
+            index = {}
+            for node in ast.walk(self.tree):
+                if type(node) is ast.Name:
+                    index.setdefault(node.id, []).append(node)
+            self._name_index = index
+        return index.get(name, [])
+
     def error(
         self,
         node: ast.expr | ast.stmt,
@@ -74,106 +179,18 @@ class PatternChecker(NodeVisitorWithParents):
         format_vars: dict[str, Any] | None = None,
     ) -> None:
         """Record an error for the given node and code."""
-        message = get_error_message(code)
+        message = _rendered_message(code)
         if format_vars:
             message = message.format(**format_vars)
 
         self.errors.append(
-            (node.lineno, node.col_offset, f"{code} {message}", type(self))
+            (node.lineno, node.col_offset, code + " " + message, self._cls)
         )
 
     # Tier 1: High Impact Effective Python Rules (EFP105, EFP213, EFP318, EFP320,
     # EFP321, EFP426)
-
-    def visit_Assign(self, node: ast.Assign) -> None:
-        """Check assignment patterns."""
-        # Tier 1 rules
-        self.assignment_rules.check_efp105_sequential_indexing(node, self)
-
-        # Future Tier 2 rules
-        self.assignment_rules.check_efp216_catch_all_unpacking(node, self)
-        self.dictionary_rules.check_efp429_avoid_deep_nesting(node, self)
-
-        # Future Tier 3 rules
-        self.function_rules.check_efp104_helper_functions(node, self)
-        self.function_rules.check_efp108_assignment_expressions(node, self)
-
-        self.generic_visit(node)
-
-    def visit_For(self, node: ast.For) -> None:
-        """Check for loop patterns."""
-        # Tier 1 rules
-        self.iteration_rules.check_efp318_parallel_iteration(node, self)
-        self.iteration_rules.check_efp320_loop_variables_after_loop(node, self)
-
-        # Future Tier 3 rules
-        self.iteration_rules.check_efp317_enumerate_usage(node, self)
-
-        self.generic_visit(node)
-
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        """Check function definition patterns."""
-        # Tier 1 rules
-        self.iteration_rules.check_efp321_defensive_iteration(node, self)
-
-        # Future Tier 2 rules
-        self.function_rules.check_efp537_keyword_only_arguments(node, self)
-        self.function_rules.check_efp538_functools_wraps(node, self)
-
-        # Future Tier 3 rules
-        self.iteration_rules.check_efp645_yield_from(node, self)
-
-        self.generic_visit(node)
-
-    def visit_Try(self, node: ast.Try) -> None:
-        """Check try/except patterns."""
-        # Tier 1 rules
-        self.dictionary_rules.check_efp426_dict_get_patterns(node, self)
-
-        self.generic_visit(node)
-
-    def visit_List(self, node: ast.List) -> None:
-        """Check list literal patterns."""
-        # Tier 1 rules
-        self.string_rules.check_efp213_context_aware_concatenation(node, self)
-
-        self.generic_visit(node)
-
-    def visit_Call(self, node: ast.Call) -> None:
-        """Check function call patterns."""
-        # Future Tier 2 rules
-        self.dictionary_rules.check_efp427_defaultdict_usage(node, self)
-        self.comprehension_rules.check_efp12103_deque_for_queues(node, self)
-
-        self.generic_visit(node)
-
-    def visit_Return(self, node: ast.Return) -> None:
-        """Check return statement patterns."""
-        # Future Tier 2 rules
-        self.function_rules.check_efp531_return_objects(node, self)
-
-        self.generic_visit(node)
-
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
-        """Check class definition patterns."""
-        # Future Tier 2 rules
-        self.function_rules.check_efp748_functions_vs_classes(node, self)
-
-        self.generic_visit(node)
-
-    def visit_Subscript(self, node: ast.Subscript) -> None:
-        """Check subscript patterns."""
-        # Future Tier 3 rules
-        self.string_rules.check_efp215_avoid_striding_slicing(node, self)
-
-        self.generic_visit(node)
-
-    def visit_ListComp(self, node: ast.ListComp) -> None:
-        """Check list comprehension patterns."""
-        # Future Tier 3 rules
-        self.comprehension_rules.check_efp641_comprehension_complexity(node, self)
-
-        self.generic_visit(node)
+    # All dispatch happens in run()'s stack loop; there is deliberately no
+    # generic_visit override so the registry has exactly one consumer.
 
     # Future implementation notes for remaining tiers
     # All rule logic has been moved to organized rule modules in rules/ directory
@@ -211,12 +228,20 @@ class PerformanceChecker(NodeVisitorWithParents):
     name = "flake8-patterns-performance"
     version = __version__
 
+    __slots__ = ("_cls", "_loop_depth", "errors", "filename", "tree")
+
     def __init__(self, tree: ast.AST, filename: str = "(none)") -> None:
         """Initialize the performance checker with an AST tree."""
         super().__init__()
         self.tree = tree
         self.filename = filename
         self.errors: list[Error] = []
+        self._cls = type(self)
+        # Loop nesting counter maintained during traversal; the HPP rules
+        # ask "am I inside a loop?" constantly, so keep it O(1) instead of
+        # scanning ancestors per query.
+        self._loop_depth = 0
+        attach_parents(tree)
 
     def run(self) -> Generator[Error]:
         """Run the performance checker and yield errors."""
@@ -224,6 +249,35 @@ class PerformanceChecker(NodeVisitorWithParents):
         self.visit(self.tree)
         yield from self.errors
 
+    def _is_in_loop(self) -> bool:
+        """Check if the current node is nested inside a for/while loop."""
+        return self._loop_depth > 0
+
+    def _visit_loop(self, node: ast.For | ast.AsyncFor | ast.While) -> None:
+        """Track loop nesting around the subtree visit."""
+        self._loop_depth += 1
+        try:
+            self.generic_visit(node)
+        finally:
+            self._loop_depth -= 1
+
+    visit_For = _visit_loop
+    visit_AsyncFor = _visit_loop
+    visit_While = _visit_loop
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Visit children directly, pruning subtrees with nothing to check.
+
+        Skips the stdlib generic_visit's iter_fields/isinstance(list)
+        bookkeeping and stops at node types whose subtrees cannot contain
+        patterns the performance rules look for.
+        """
+        if type(node) in _PERF_LEAF_TYPES:
+            return
+        visit = self.visit
+        for child in child_nodes(node):
+            visit(child)
+
     def error(
         self,
         node: ast.expr | ast.stmt,
@@ -231,12 +285,12 @@ class PerformanceChecker(NodeVisitorWithParents):
         format_vars: dict[str, Any] | None = None,
     ) -> None:
         """Record an error for the given node and code."""
-        message = get_error_message(code)
+        message = _rendered_message(code)
         if format_vars:
             message = message.format(**format_vars)
 
         self.errors.append(
-            (node.lineno, node.col_offset, f"{code} {message}", type(self))
+            (node.lineno, node.col_offset, code + " " + message, self._cls)
         )
 
     # Future High Performance Python rules implementation
@@ -5,15 +5,197 @@ Based on "Effective Python" (3rd Edition) by Brett Slatkin.
 """
 
 import ast
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple, cast
 
 if TYPE_CHECKING:
     from flake8_patterns.checker import PatternChecker
 
+# Hoisted isinstance argument: a plain tuple avoids building a fresh
+# types.UnionType on every hot-path check.
+_NAME_OR_ATTR = (ast.Name, ast.Attribute)
+
+# Statement nodes that carry a .body list; used to cheaply reject parents
+# before touching parent.body at all. _BodyContainer is the same set as a
+# union type, so the membership test can narrow parent for mypy.
+_BodyContainer = (
+    ast.Module
+    | ast.FunctionDef
+    | ast.AsyncFunctionDef
+    | ast.ClassDef
+    | ast.For
+    | ast.AsyncFor
+    | ast.While
+    | ast.If
+    | ast.With
+    | ast.AsyncWith
+    | ast.Try
+    | ast.TryStar
+    | ast.ExceptHandler
+    | ast.match_case
+)
+_BODY_CONTAINER_TYPES = frozenset(
+    {
+        ast.Module,
+        ast.FunctionDef,
+        ast.AsyncFunctionDef,
+        ast.ClassDef,
+        ast.For,
+        ast.AsyncFor,
+        ast.While,
+        ast.If,
+        ast.With,
+        ast.AsyncWith,
+        ast.Try,
+        ast.TryStar,
+        ast.ExceptHandler,
+        ast.match_case,
+    }
+)
+
+
+class IndexingRun(NamedTuple):
+    """A run of consecutive constant-index assignments to one variable.
+
+    Carries the line span so future fixit tooling can rewrite the run
+    without re-traversing the tree.
+    """
+
+    start_lineno: int
+    end_lineno: int
+    indexed_var: str
+    assignments: list[ast.Assign]
+    indices: set[int]
+    # Names bound by the run; empty when any target is an attribute
+    # (self.x = item[0] is treated as final usage outright).
+    assigned_vars: list[str]
+
+
+class SequentialIndexingDetector:
+    """Single-pass scanner for sequential indexing runs in a statement list.
+
+    Scans each body once, grouping consecutive assignments that index the
+    same variable with a constant integer via a small keep-running/break
+    state machine. Results are cached per body (keyed by id()), so every
+    assignment visited within the same block shares one scan.
+    """
+
+    __slots__ = ("_positions_cache", "_runs_cache")
+
+    def __init__(self) -> None:
+        self._runs_cache: dict[int, list[IndexingRun]] = {}
+        self._positions_cache: dict[int, dict[int, int]] = {}
+
+    def runs_for_body(self, body: list[ast.stmt]) -> list[IndexingRun]:
+        """Return all indexing runs in a statement list (cached)."""
+        key = id(body)
+        cached = self._runs_cache.get(key)
+        if cached is None:
+            cached = self._scan_body(body)
+            self._runs_cache[key] = cached
+        return cached
+
+    def positions_for_body(self, body: list[ast.stmt]) -> dict[int, int]:
+        """Map id(statement) -> index within the statement list (cached).
+
+        Statement lists are in source order, so run follow-ups can slice the
+        body by index instead of rescanning it with lineno comparisons.
+        """
+        key = id(body)
+        cached = self._positions_cache.get(key)
+        if cached is None:
+            cached = {id(stmt): index for index, stmt in enumerate(body)}
+            self._positions_cache[key] = cached
+        return cached
+
+    def _scan_body(self, body: list[ast.stmt]) -> list[IndexingRun]:
+        """Group constant-index assignments into runs in one pass."""
+        runs: list[IndexingRun] = []
+        run_var: str | None = None
+        run_assignments: list[ast.Assign] = []
+        # Built as a set up front: the consecutive-index check only ever
+        # needs membership tests, so there is no list to convert later.
+        run_indices: set[int] = set()
+        run_names: list[str] = []
+        run_has_attr_target = False
+
+        def flush() -> None:
+            if run_var is not None and run_assignments:
+                runs.append(
+                    IndexingRun(
+                        run_assignments[0].lineno,
+                        run_assignments[-1].lineno,
+                        run_var,
+                        run_assignments,
+                        run_indices,
+                        [] if run_has_attr_target else run_names,
+                    )
+                )
+
+        for stmt in body:
+            extracted = self._extract_indexing(stmt)
+            if extracted is None:
+                # Non-matching statement breaks the current run
+                flush()
+                run_var = None
+                run_assignments = []
+                run_indices = set()
+                run_names = []
+                run_has_attr_target = False
+                continue
+
+            assignment, var, index = extracted
+            if var != run_var:
+                flush()
+                run_var = var
+                run_assignments = []
+                run_indices = set()
+                run_names = []
+                run_has_attr_target = False
+            run_assignments.append(assignment)
+            run_indices.add(index)
+            # Collect bound names in the same sweep instead of re-walking
+            # the run's assignments later for the usage heuristic.
+            target = assignment.targets[0]
+            if type(target) is ast.Name:
+                run_names.append(target.id)
+            else:
+                run_has_attr_target = True
+
+        flush()
+        return runs
+
+    @staticmethod
+    def _extract_indexing(stmt: ast.stmt) -> tuple[ast.Assign, str, int] | None:
+        """Extract (assignment, indexed variable, index) if stmt qualifies.
+
+        Runs once per statement in every scanned body, so the filter uses
+        identity type checks instead of isinstance method dispatch.
+        """
+        if (
+            type(stmt) is ast.Assign
+            and len(stmt.targets) == 1
+            and type(stmt.targets[0]) in _NAME_OR_ATTR
+            and type(stmt.value) is ast.Subscript
+            and type(stmt.value.value) is ast.Name
+            and type(stmt.value.slice) is ast.Constant
+            and type(stmt.value.slice.value) is int
+        ):
+            return stmt, stmt.value.value.id, stmt.value.slice.value
+        return None
+
 
 class AssignmentPatternRules:
     """Rules for assignment and unpacking patterns."""
 
+    __slots__ = ("_detector", "_run_decision_cache")
+
+    def __init__(self) -> None:
+        self._detector = SequentialIndexingDetector()
+        # Memoized per-run pattern decision, keyed by id() of the run's
+        # assignment list. A run of K assignments would otherwise redo the
+        # consecutive-index check and the final-usage walk K times.
+        self._run_decision_cache: dict[int, bool] = {}
+
     def check_efp105_sequential_indexing(
         self, node: ast.Assign, checker: "PatternChecker"
     ) -> None:
@@ -61,7 +243,7 @@ class AssignmentPatternRules:
         # All validation checks combined
         valid_structure = (
             len(node.targets) == 1
-            and isinstance(node.targets[0], ast.Name | ast.Attribute)
+            and isinstance(node.targets[0], _NAME_OR_ATTR)
             and isinstance(node.value, ast.Subscript)
         )
 
@@ -87,156 +269,119 @@ class AssignmentPatternRules:
         self,
         indexed_var: str,
         _index_value: int,
-        _current_node: ast.Assign,
+        current_node: ast.Assign,
         checker: "PatternChecker",
     ) -> bool:
         """Check if there are other assignments that form a sequential pattern."""
-        # Get the parent node (should be a statement list)
-        parent = checker.get_parent()
-        if not parent or not hasattr(parent, "body"):
+        # Get the parent node (should be a statement-list container)
+        raw_parent = checker.get_parent()
+        if raw_parent is None or type(raw_parent) not in _BODY_CONTAINER_TYPES:
             return False
+        # type(raw_parent) is in the container set, so the cast only states
+        # what the membership test already proved.
+        parent = cast("_BodyContainer", raw_parent)
+
+        # Find the run this assignment belongs to (single cached scan per body)
+        for run in self._detector.runs_for_body(parent.body):
+            if run.indexed_var != indexed_var:
+                continue
+            if current_node not in run.assignments:
+                continue
+            return self._run_forms_pattern(run, parent, checker)
 
-        # Find all assignments in the same scope
-        assignments = [
-            stmt
-            for stmt in parent.body
-            if isinstance(stmt, ast.Assign)
-            and self._is_indexing_assignment(stmt, indexed_var)
-        ]
-
-        # Need at least 2 assignments to form a pattern
-        if len(assignments) < 2:
-            return False
+        return False
 
-        # Check if we have sequential indices
-        indices = [
-            assignment.value.slice.value
-            for assignment in assignments
-            if isinstance(assignment.value, ast.Subscript)
-            and isinstance(assignment.value.slice, ast.Constant)
-            and isinstance(assignment.value.slice.value, int)
-        ]
-
-        # Look for any consecutive subsequence of length >= 2
-        if not self._has_consecutive_subsequence(indices):
-            return False
+    def _run_forms_pattern(
+        self, run: IndexingRun, parent: ast.AST, checker: "PatternChecker"
+    ) -> bool:
+        """Decide once per run whether it forms a reportable pattern."""
+        key = id(run.assignments)
+        cached = self._run_decision_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Need at least 2 assignments with a consecutive index subsequence
+        # to form a pattern
+        decision = len(run.assignments) >= 2 and self._has_consecutive_subsequence(
+            run.indices
+        )
 
         # Additional heuristic: Don't trigger if all assigned variables
         # are subsequently used as indices (intermediate pattern)
-        return self._is_final_usage_pattern(assignments, parent)
+        if decision:
+            decision = self._is_final_usage_pattern(run, parent, checker)
 
-    def _has_consecutive_subsequence(self, indices: list[int]) -> bool:
+        self._run_decision_cache[key] = decision
+        return decision
+
+    def _has_consecutive_subsequence(self, indices: set[int]) -> bool:
         """Check if there's a consecutive subsequence of length >= 2."""
         if len(indices) < 2:
             return False
 
-        indices_set = set(indices)
-
-        # Look for consecutive sequences
-        for start_idx in indices_set:
-            consecutive_count = 0
-            current_idx = start_idx
-
-            # Count consecutive indices starting from start_idx
-            while current_idx in indices_set:
-                consecutive_count += 1
-                current_idx += 1
-
-            # If we found a consecutive sequence of 2 or more
-            if consecutive_count >= 2:
-                return True
-
-        return False
+        # Two consecutive integers exist iff some index has a successor
+        return any(index + 1 in indices for index in indices)
 
     def _is_final_usage_pattern(
-        self, assignments: list[ast.Assign], parent: ast.AST
+        self, run: IndexingRun, parent: ast.AST, checker: "PatternChecker"
     ) -> bool:
         """Check if this is a final usage pattern (not intermediate variables)."""
-        assigned_vars = self._get_assigned_variable_names(assignments)
+        assigned_vars = run.assigned_vars
         if not assigned_vars:
             return True
 
-        subsequent_statements = self._get_subsequent_statements(assignments, parent)
-        if not subsequent_statements:
-            return True
-
-        # Count how many assigned variables are used as indices vs other uses
-        index_usage_count, other_usage_count = self._count_variable_usage(
-            assigned_vars, subsequent_statements
-        )
-
-        # If most usage is as indices, it's probably intermediate
-        # Otherwise, it's likely final usage that should trigger EFP105
-        return not (index_usage_count > 0 and other_usage_count == 0)
-
-    def _get_assigned_variable_names(self, assignments: list[ast.Assign]) -> list[str]:
-        """Extract variable names from assignments."""
-        assigned_vars = []
-        for assignment in assignments:
-            if len(assignment.targets) == 1:
-                target = assignment.targets[0]
-                if isinstance(target, ast.Name):
-                    assigned_vars.append(target.id)
-                elif isinstance(target, ast.Attribute):
-                    # For self.x patterns, this is likely final usage
-                    return []  # Signal to treat as final usage
-        return assigned_vars
-
-    def _get_subsequent_statements(
-        self, assignments: list[ast.Assign], parent: ast.AST
-    ) -> list[ast.AST]:
-        """Get statements that come after the assignments."""
-        if not hasattr(parent, "body"):
-            return []
-
-        assignment_lines = {assign.lineno for assign in assignments}
-        max_assignment_line = max(assignment_lines)
-
-        return [
-            stmt
-            for stmt in parent.body
-            if hasattr(stmt, "lineno") and stmt.lineno > max_assignment_line
-        ]
-
-    def _count_variable_usage(
-        self, assigned_vars: list[str], statements: list[ast.AST]
-    ) -> tuple[int, int]:
-        """Count how variables are used: as indices vs other uses."""
-        index_usage_count = 0
-        other_usage_count = 0
-
-        for stmt in statements:
-            for node in ast.walk(stmt):
-                if isinstance(node, ast.Subscript) and isinstance(node.slice, ast.Name):
-                    if node.slice.id in assigned_vars:
-                        index_usage_count += 1
-                elif isinstance(node, ast.Name) and node.id in assigned_vars:
-                    # Check if this is not part of a subscript slice
-                    parent_node = getattr(node, "parent", None)
-                    is_subscript_slice = (
-                        isinstance(parent_node, ast.Subscript)
-                        and parent_node.slice == node
-                    )
-                    if not is_subscript_slice:
-                        other_usage_count += 1
-
-        return index_usage_count, other_usage_count
-
-    def _is_indexing_assignment(self, node: ast.Assign, target_var: str) -> bool:
-        """Check if assignment is indexing the target variable."""
-        if (
-            len(node.targets) != 1
-            or not isinstance(node.targets[0], ast.Name | ast.Attribute)
-            or not isinstance(node.value, ast.Subscript)
-            or not isinstance(node.value.value, ast.Name)
-        ):
-            return False
+        # Only index usage afterwards means the run is probably intermediate;
+        # any other usage (or no usage) is final usage that should trigger
+        return self._usage_decision(assigned_vars, run, parent, checker)
 
-        # Check if we're indexing the same variable
-        if node.value.value.id != target_var:
-            return False
+    def _usage_decision(
+        self,
+        assigned_vars: list[str],
+        run: IndexingRun,
+        parent: ast.AST,
+        checker: "PatternChecker",
+    ) -> bool:
+        """Decide final-vs-intermediate usage with an early exit.
 
-        # Ensure we have a constant integer index (no variables)
-        return isinstance(node.value.slice, ast.Constant) and isinstance(
-            node.value.slice.value, int
-        )
+        Queries the checker's module-wide Name index instead of walking the
+        subsequent statements, keeping only occurrences that live under a
+        statement positioned after the run in this body. The first
+        non-index usage proves the run is final usage, so the scan stops
+        there instead of tallying full counts.
+        """
+        positions = self._detector.positions_for_body(parent.body)  # type: ignore[attr-defined]
+        last_index = positions[id(run.assignments[-1])]
+
+        saw_index_usage = False
+
+        for var in assigned_vars:
+            for name_node in checker.name_occurrences(var):
+                stmt = self._enclosing_statement(name_node, parent)
+                if stmt is None:
+                    continue
+                position = positions.get(id(stmt))
+                if position is None or position <= last_index:
+                    continue
+                name_parent = getattr(name_node, "parent", None)
+                if (
+                    type(name_parent) is ast.Subscript
+                    and name_parent.slice is name_node
+                ):
+                    saw_index_usage = True
+                else:
+                    return True
+
+        # Used exclusively as indices afterwards -> intermediate pattern
+        return not saw_index_usage
+
+    @staticmethod
+    def _enclosing_statement(node: ast.AST, parent: ast.AST) -> ast.AST | None:
+        """Find the child of parent whose subtree contains node, if any."""
+        current = node
+        ancestor = getattr(current, "parent", None)
+        while ancestor is not None:
+            if ancestor is parent:
+                return current
+            current = ancestor
+            ancestor = getattr(current, "parent", None)
+        return None
@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class ComprehensionPatternRules:
     """Rules for comprehension and generator patterns."""
 
+    __slots__ = ()
+
     def check_efp641_comprehension_complexity(
         self, node: ast.ListComp, checker: "PatternChecker"
     ) -> None:
@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class DictionaryPatternRules:
     """Rules for dictionary and mapping patterns."""
 
+    __slots__ = ()
+
     def check_efp426_dict_get_patterns(
         self, node: ast.Try, checker: "PatternChecker"
     ) -> None:
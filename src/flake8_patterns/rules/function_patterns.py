@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class FunctionPatternRules:
     """Rules for function and API design patterns."""
 
+    __slots__ = ()
+
     def check_efp531_return_objects(
         self, node: ast.Return, checker: "PatternChecker"
     ) -> None:
@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class IterationPatternRules:
     """Rules for iteration and loop patterns."""
 
+    __slots__ = ()
+
     def check_efp318_parallel_iteration(
         self, node: ast.For, checker: "PatternChecker"
     ) -> None:
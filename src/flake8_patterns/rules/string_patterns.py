@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class StringPatternRules:
     """Rules for string operation patterns."""
 
+    __slots__ = ()
+
     def check_efp213_context_aware_concatenation(
         self, node: ast.List, checker: "PatternChecker"
     ) -> None:
@@ -2,7 +2,10 @@
 
 import ast
 import builtins
+import operator
 import sys
+from collections.abc import Callable
+from typing import Any, cast
 
 # Python version detection for feature compatibility
 PYTHON_VERSION = sys.version_info
@@ -11,19 +14,48 @@ PYTHON_312_PLUS = PYTHON_VERSION >= (3, 12)
 PYTHON_313_PLUS = PYTHON_VERSION >= (3, 13)
 
 
+# Numeric literal value types (bool included, matching isinstance semantics)
+_NUMERIC_TYPES = (int, float, bool)
+
+# Hoisted isinstance argument tuples: X | Y builds a fresh types.UnionType
+# per call, and even inline tuples allocate; these are shared objects.
+_LOOP_TYPES = (ast.For, ast.While)
+_COMP_TYPES = (ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)
+_FUNC_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+def literal_kind(node: ast.AST) -> str | None:
+    """Classify a literal node with a single type dispatch.
+
+    Returns "str", "num", "none" or "other" for constant nodes, and None
+    for anything that is not a constant. One check here replaces the
+    isinstance pair each is_*_literal helper used to perform.
+    """
+    if type(node) is not ast.Constant:
+        return None
+    value = node.value
+    if type(value) is str:
+        return "str"
+    if type(value) in _NUMERIC_TYPES:
+        return "num"
+    if value is None:
+        return "none"
+    return "other"
+
+
 def is_string_literal(node: ast.AST) -> bool:
     """Check if a node is a string literal."""
-    return isinstance(node, ast.Constant) and isinstance(node.value, str)
+    return literal_kind(node) == "str"
 
 
 def is_numeric_literal(node: ast.AST) -> bool:
     """Check if a node is a numeric literal."""
-    return isinstance(node, ast.Constant) and isinstance(node.value, int | float)
+    return literal_kind(node) == "num"
 
 
 def is_none_literal(node: ast.AST) -> bool:
     """Check if a node is None literal."""
-    return isinstance(node, ast.Constant) and node.value is None
+    return literal_kind(node) == "none"
 
 
 def get_string_value(node: ast.AST) -> str | None:
@@ -33,20 +65,40 @@ def get_string_value(node: ast.AST) -> str | None:
     return None
 
 
+# Type-dispatched accessors for Call.func; one dict probe replaces the
+# isinstance chain on a helper that runs for every Call node.
+_FUNC_NAME_GETTERS: dict[type, Callable[[Any], str]] = {
+    ast.Name: operator.attrgetter("id"),
+    ast.Attribute: operator.attrgetter("attr"),
+}
+
+
 def get_function_name(node: ast.Call) -> str | None:
     """Extract function name from a Call node."""
-    if isinstance(node.func, ast.Name):
-        return node.func.id
-    if isinstance(node.func, ast.Attribute):
-        return node.func.attr
-    return None
+    func = node.func
+    getter = _FUNC_NAME_GETTERS.get(type(func))
+    return getter(func) if getter is not None else None
+
+
+# Sentinel distinguishing "not cached yet" from a cached None result
+_MISSING = object()
 
 
 def get_full_function_name(node: ast.Call) -> str | None:
-    """Extract full function name including module/object."""
+    """Extract full function name including module/object.
+
+    The result is cached on the Call node itself, so repeated lookups by
+    different rules cost one attribute read instead of re-walking the
+    attribute chain.
+    """
+    cached = getattr(node, "_full_name", _MISSING)
+    if cached is not _MISSING:
+        return cached  # type: ignore[return-value]
+
+    result: str | None = None
     if isinstance(node.func, ast.Name):
-        return node.func.id
-    if isinstance(node.func, ast.Attribute):
+        result = node.func.id
+    elif isinstance(node.func, ast.Attribute):
         # Try to build full name like 'obj.method'
         parts = []
         current: ast.expr = node.func
@@ -55,20 +107,22 @@ def get_full_function_name(node: ast.Call) -> str | None:
             current = current.value
         if isinstance(current, ast.Name):
             parts.append(current.id)
-            return ".".join(reversed(parts))
-    return None
+            result = ".".join(reversed(parts))
+
+    # SLF001: _full_name is our own cache slot, not a foreign private member
+    node._full_name = result  # type: ignore[attr-defined]  # noqa: SLF001
+    return result
 
 
 def is_loop_node(node: ast.AST) -> bool:
     """Check if node is a loop (for/while)."""
-    return isinstance(node, ast.For | ast.While)
+    node_type = type(node)
+    return node_type is ast.For or node_type is ast.While
 
 
 def is_comprehension_node(node: ast.AST) -> bool:
     """Check if node is a comprehension."""
-    return isinstance(
-        node, ast.ListComp | ast.SetComp | ast.DictComp | ast.GeneratorExp
-    )
+    return type(node) in _COMP_TYPES
 
 
 def find_parent_loop(_node: ast.AST, parents: list[ast.AST]) -> ast.AST | None:
@@ -82,7 +136,7 @@ def find_parent_loop(_node: ast.AST, parents: list[ast.AST]) -> ast.AST | None:
 def find_parent_function(_node: ast.AST, parents: list[ast.AST]) -> ast.AST | None:
     """Find the nearest parent function/method."""
     for parent in reversed(parents):
-        if isinstance(parent, ast.FunctionDef | ast.AsyncFunctionDef):
+        if type(parent) in _FUNC_TYPES:
             return parent
     return None
 
@@ -90,19 +144,23 @@ def find_parent_function(_node: ast.AST, parents: list[ast.AST]) -> ast.AST | No
 def find_parent_class(_node: ast.AST, parents: list[ast.AST]) -> ast.AST | None:
     """Find the nearest parent class."""
     for parent in reversed(parents):
-        if isinstance(parent, ast.ClassDef):
+        if type(parent) is ast.ClassDef:
             return parent
     return None
 
 
 def get_variable_name(node: ast.AST) -> str | None:
-    """Extract variable name from various node types."""
+    """Extract variable name from various node types.
+
+    Subscript chains like a[i][j][k] are peeled iteratively instead of
+    recursing, so deep chains cost no extra Python frames.
+    """
+    while isinstance(node, ast.Subscript):
+        node = node.value
     if isinstance(node, ast.Name):
         return node.id
     if isinstance(node, ast.Attribute):
         return node.attr
-    if isinstance(node, ast.Subscript):
-        return get_variable_name(node.value)
     return None
 
 
@@ -111,34 +169,47 @@ def is_builtin_function(name: str) -> bool:
     return hasattr(builtins, name)
 
 
-def is_method_call(node: ast.Call, method_names: str | set[str]) -> bool:
-    """Check if node is a method call with specific name(s)."""
-    if isinstance(method_names, str):
-        method_names = {method_names}
+def is_method_call(node: ast.Call, method_names: frozenset[str]) -> bool:
+    """Check if node is a method call with one of the given names.
 
-    if isinstance(node.func, ast.Attribute):
+    Callers must pass a frozenset built once at module/class level; these
+    helpers run for every Call node, so the old per-call str-to-set
+    conversion was pure allocation overhead.
+    """
+    if type(node.func) is ast.Attribute:
         return node.func.attr in method_names
     return False
 
 
-def is_function_call(node: ast.Call, function_names: str | set[str]) -> bool:
-    """Check if node is a function call with specific name(s)."""
-    if isinstance(function_names, str):
-        function_names = {function_names}
+def is_function_call(node: ast.Call, function_names: frozenset[str]) -> bool:
+    """Check if node is a function call with one of the given names.
 
+    Like is_method_call, expects a frozenset built once by the caller.
+    """
     func_name = get_function_name(node)
     return func_name in function_names if func_name else False
 
 
-def count_nodes_in_tree(tree: ast.AST, node_type: type) -> int:
-    """Count nodes of specific type in AST tree."""
+def count_string_concatenations(node: ast.AST) -> int:
+    """Count chained + operations down the left spine of a BinOp chain.
+
+    a + b + c parses as BinOp(BinOp(a, +, b), +, c); walking .left counts
+    the additions without recursion or hasattr probing.
+    """
     count = 0
-    for node in ast.walk(tree):
-        if isinstance(node, node_type):
-            count += 1
+    current = node
+    while isinstance(current, ast.BinOp) and isinstance(current.op, ast.Add):
+        count += 1
+        current = current.left
     return count
 
 
+def count_nodes_in_tree(tree: ast.AST, node_type: type) -> int:
+    """Count nodes of specific type in AST tree."""
+    matches = isinstance
+    return sum(1 for node in ast.walk(tree) if matches(node, node_type))
+
+
 def get_assigned_name(node: ast.AST) -> str | None:
     """Get the variable name being assigned to."""
     if isinstance(node, ast.Assign):
@@ -153,105 +224,213 @@ def get_assigned_name(node: ast.AST) -> str | None:
 
 def is_constant_value(node: ast.AST) -> bool:
     """Check if node represents a constant value."""
-    return isinstance(node, ast.Constant | ast.Num | ast.Str | ast.NameConstant)
+    return type(node) is ast.Constant
 
 
 def extract_constant_value(node: ast.AST) -> object:
     """Extract the constant value from a node."""
-    if isinstance(node, ast.Constant):
-        return node.value
-    if isinstance(node, ast.Num):  # Python < 3.8 compatibility
-        return node.n
-    if isinstance(node, ast.Str):  # Python < 3.8 compatibility
-        return node.s
-    if isinstance(node, ast.NameConstant):  # Python < 3.8 compatibility
-        return node.value
-    return None
+    return node.value if type(node) is ast.Constant else None
+
+
+# Per-node-type cache of field names that can hold AST children. The
+# grammar fixes the field types per node class, so the reflection that
+# ast.iter_child_nodes repeats on every call happens once per type here:
+# identifier/constant fields are dropped, AST/list fields kept, and a
+# field first seen as None is kept too (optional expr slots).
+_CHILD_FIELDS: dict[type, tuple[str, ...]] = {}
+
+
+def child_nodes(node: ast.AST) -> list[ast.AST]:
+    """List direct AST children, caching child-bearing fields per type."""
+    node_type = type(node)
+    fields = _CHILD_FIELDS.get(node_type)
+    if fields is None:
+        # Union syntax is fine here: this branch runs once per node type,
+        # not per node, so the types.UnionType cost never repeats.
+        fields = tuple(
+            name
+            for name in node_type._fields
+            if isinstance(getattr(node, name, None), ast.AST | list)
+            or getattr(node, name, False) is None
+        )
+        _CHILD_FIELDS[node_type] = fields
+
+    children: list[ast.AST] = []
+    append = children.append
+    for name in fields:
+        value = getattr(node, name, None)
+        if isinstance(value, ast.AST):
+            append(value)
+        elif type(value) is list:
+            for item in value:
+                if isinstance(item, ast.AST):
+                    append(item)
+    return children
+
+
+def parent_of(node: ast.AST) -> ast.AST | None:
+    """Typed read of the parent link installed by attach_parents.
+
+    getattr with a default infers as object under mypy --strict; the cast
+    centralizes the parent-link type in one place.
+    """
+    return cast("ast.AST | None", getattr(node, "parent", None))
+
+
+def attach_parents(tree: ast.AST) -> None:
+    """Annotate every node in the tree with a .parent attribute.
+
+    One O(tree) pass at tree-receive time replaces per-node stack
+    bookkeeping during traversal; all parent queries become attribute
+    reads.
+    """
+    stack = [tree]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        parent = pop()
+        children = child_nodes(parent)
+        for child in children:
+            child.parent = parent  # type: ignore[attr-defined]
+        extend(children)
 
 
 class NodeVisitorWithParents(ast.NodeVisitor):
-    """AST visitor that tracks parent nodes."""
+    """AST visitor that tracks parent nodes.
+
+    Expects the tree to be annotated with attach_parents before visiting;
+    the visitor then only remembers the node currently being visited and
+    follows .parent links for ancestor queries.
+    """
+
+    __slots__ = ("_current", "_visitors")
 
     def __init__(self) -> None:
-        self.parents: list[ast.AST] = []
-        self._node_stack: list[ast.AST] = []
+        self._current: ast.AST | None = None
+        # Bound visitor methods memoized per concrete node type; replaces
+        # the "visit_" + name string concat and getattr that the stdlib
+        # NodeVisitor.visit performs on every single node.
+        self._visitors: dict[type, object] = {}
 
     def visit(self, node: ast.AST) -> object:
-        """Visit a node and track parents."""
-        self.parents.append(node)
-        self._node_stack.append(node)
-        try:
-            result = super().visit(node)
-        finally:
-            self.parents.pop()
-            self._node_stack.pop()
-        return result
+        """Visit a node, tracking the current position in the tree."""
+        self._current = node
+        node_type = type(node)
+        visitor = self._visitors.get(node_type)
+        if visitor is None:
+            visitor = getattr(self, "visit_" + node_type.__name__, self.generic_visit)
+            self._visitors[node_type] = visitor
+        return visitor(node)  # type: ignore[operator]
 
     def get_parent(self, offset: int = 1) -> ast.AST | None:
         """Get parent node at given offset (1 = immediate parent)."""
-        if len(self.parents) > offset:
-            return self.parents[-(offset + 1)]
-        return None
+        node: ast.AST | None = self._current
+        for _ in range(offset):
+            if node is None:
+                return None
+            node = parent_of(node)
+        return node
 
     def get_ancestors(self) -> list[ast.AST]:
-        """Get all ancestor nodes (excluding current)."""
-        return self.parents[:-1] if self.parents else []
-
-    def is_inside_node_type(self, node_type: type) -> bool:
+        """Get all ancestor nodes (excluding current), root first."""
+        ancestors: list[ast.AST] = []
+        node = parent_of(self._current) if self._current is not None else None
+        while node is not None:
+            ancestors.append(node)
+            node = parent_of(node)
+        ancestors.reverse()
+        return ancestors
+
+    def is_inside_node_type(self, node_type: type[ast.AST]) -> bool:
         """Check if we're currently inside a node of given type."""
-        return any(isinstance(parent, node_type) for parent in self.parents)
-
-    def get_nearest_ancestor(self, node_type: type) -> ast.AST | None:
+        node = self._current
+        while node is not None:
+            if isinstance(node, node_type):
+                return True
+            node = parent_of(node)
+        return False
+
+    def get_nearest_ancestor(self, node_type: type[ast.AST]) -> ast.AST | None:
         """Get the nearest ancestor of given type."""
-        for parent in reversed(self.parents[:-1]):
-            if isinstance(parent, node_type):
-                return parent
+        node = parent_of(self._current) if self._current is not None else None
+        while node is not None:
+            if isinstance(node, node_type):
+                return node
+            node = parent_of(node)
         return None
 
 
 class ASTAnalyzer:
     """Helper class for complex AST analysis."""
 
+    __slots__ = ("_nodes_by_type", "_total_nodes", "tree")
+
     def __init__(self, tree: ast.AST) -> None:
         self.tree = tree
+        # Built lazily: an analyzer that is constructed but never queried
+        # costs nothing. See _build_index.
+        self._nodes_by_type: dict[type, list[ast.AST]] | None = None
+        self._total_nodes = 0
+
+    def _build_index(self) -> dict[type, list[ast.AST]]:
+        """Bucket all nodes by concrete type in a single pass (cached).
+
+        Every query becomes a dict lookup instead of a fresh traversal.
+        An explicit stack over iter_child_nodes skips ast.walk's generator
+        send/yield overhead and is safe on arbitrarily deep trees.
+        """
+        buckets = self._nodes_by_type
+        if buckets is None:
+            buckets = {}
+            total = 0
+            children_of = child_nodes
+            stack = [self.tree]
+            pop = stack.pop
+            extend = stack.extend
+            while stack:
+                node = pop()
+                buckets.setdefault(type(node), []).append(node)
+                total += 1
+                extend(children_of(node))
+            self._nodes_by_type = buckets
+            self._total_nodes = total
+        return buckets
 
     def find_all_nodes(self, node_type: type) -> list[ast.AST]:
-        """Find all nodes of given type."""
-        return [node for node in ast.walk(self.tree) if isinstance(node, node_type)]
+        """Find all nodes of given (concrete) type."""
+        return self._build_index().get(node_type, [])
 
     def find_assignments_to(self, var_name: str) -> list[ast.AST]:
         """Find all assignments to a specific variable."""
-        assignments: list[ast.AST] = []
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.Assign | ast.AugAssign):
-                assigned_name = get_assigned_name(node)
-                if assigned_name == var_name:
-                    assignments.append(node)
-        return assignments
+        candidates = [
+            *self.find_all_nodes(ast.Assign),
+            *self.find_all_nodes(ast.AugAssign),
+        ]
+        return [node for node in candidates if get_assigned_name(node) == var_name]
 
     def find_function_calls(self, func_name: str) -> list[ast.Call]:
         """Find all calls to a specific function."""
         return [
             node
-            for node in ast.walk(self.tree)
+            for node in self.find_all_nodes(ast.Call)
             if isinstance(node, ast.Call) and get_function_name(node) == func_name
         ]
 
     def get_complexity_metrics(self) -> dict[str, int]:
         """Get basic complexity metrics for the code."""
+        buckets = self._build_index()
+
+        def count(node_type: type) -> int:
+            bucket = buckets.get(node_type)
+            return len(bucket) if bucket is not None else 0
+
         return {
-            "total_nodes": len(list(ast.walk(self.tree))),
-            "functions": len(self.find_all_nodes(ast.FunctionDef)),
-            "classes": len(self.find_all_nodes(ast.ClassDef)),
-            "loops": len(
-                [*self.find_all_nodes(ast.For), *self.find_all_nodes(ast.While)]
-            ),
-            "conditionals": len(self.find_all_nodes(ast.If)),
-            "comprehensions": len(
-                [
-                    *self.find_all_nodes(ast.ListComp),
-                    *self.find_all_nodes(ast.SetComp),
-                    *self.find_all_nodes(ast.DictComp),
-                ]
+            "total_nodes": self._total_nodes,
+            "functions": count(ast.FunctionDef),
+            "classes": count(ast.ClassDef),
+            "loops": count(ast.For) + count(ast.While),
+            "conditionals": count(ast.If),
+            "comprehensions": (
+                count(ast.ListComp) + count(ast.SetComp) + count(ast.DictComp)
             ),
         }
@@ -2,6 +2,8 @@
 
 import ast
 import sys
+from functools import cache, lru_cache
+from operator import itemgetter
 from pathlib import Path
 
 import pytest
@@ -15,25 +17,50 @@ if src_path_str not in sys.path:
 from flake8_patterns.checker import PatternChecker  # noqa: E402
 
 
+@cache
+def _cached_parse(code: str) -> ast.AST:
+    """Parse code once per distinct source string.
+
+    The sample snippets are reused by many tests; the checker only
+    annotates the tree (it never restructures it), so sharing the parsed
+    AST across tests is safe and turns repeat parses into dict lookups.
+
+    Calling compile() with PyCF_ONLY_AST directly skips ast.parse's
+    wrapper frame and keyword normalization; the defaults already match
+    what we want (no type-comment processing, current-interpreter
+    grammar), so behavior is identical.
+    """
+    return compile(code, "test.py", "exec", flags=ast.PyCF_ONLY_AST)
+
+
 @pytest.fixture
 def checker():
     """Create a PatternChecker instance."""
 
     def _checker(code: str):
-        tree = ast.parse(code)
-        return PatternChecker(tree, filename="test.py")
+        return PatternChecker(_cached_parse(code), filename="test.py")
 
     return _checker
 
 
+@lru_cache(maxsize=512)
+def _cached_run(code: str) -> tuple:
+    """Run the checker once per distinct source string.
+
+    Several tests lint the same sample (tier1_samples entries, the
+    comprehensive fixtures); the emitted error tuples are immutable, so
+    repeat runs become a dict lookup on top of the shared parse cache.
+    """
+    checker = PatternChecker(_cached_parse(code), filename="test.py")
+    return tuple(checker.run())
+
+
 @pytest.fixture
 def run_checker():
     """Run checker on code and return errors."""
 
     def _run_checker(code: str) -> list[tuple[int, int, str]]:
-        tree = ast.parse(code)
-        checker = PatternChecker(tree, filename="test.py")
-        return list(checker.run())
+        return list(_cached_run(code))
 
     return _run_checker
 
@@ -158,7 +185,7 @@ if "item" in ["a", "b", "c", "d", "e"]:  # Will be PC001 in future
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tier1_samples():
     """Provide Tier 1 rule test samples."""
     return {
@@ -183,7 +210,7 @@ def tier1_samples():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def future_samples():
     """Provide samples for future High Performance Python rules."""
     return {
@@ -192,7 +219,7 @@ def future_samples():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def comprehensive_bad_code():
     """Comprehensive test file with multiple Tier 1 violations."""
     return '''
@@ -243,7 +270,7 @@ def process_data():
 '''
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def comprehensive_good_code():
     """Comprehensive test file with good patterns (should not trigger errors)."""
     return '''
@@ -291,37 +318,67 @@ def process_data():
 '''
 
 
-# Error code constants for testing
+# Error code constants for testing (interned so the thousands of
+# membership checks in the assert helpers hit pointer equality first)
 class ErrorCodes:
     """Expected error codes for testing."""
 
     # Tier 1 rules
-    EFP105 = "EFP105"  # Multiple-Assignment Unpacking over Indexing
-    EFP213 = "EFP213"  # Context-Aware String Concatenation
-    EFP318 = "EFP318"  # Parallel Iteration with zip()
-    EFP320 = "EFP320"  # Loop Variables After Loop Ends
-    EFP321 = "EFP321"  # Be Defensive when Iterating over Arguments
-    EFP426 = "EFP426"  # Comprehensive dict.get() patterns
+    EFP105 = sys.intern("EFP105")  # Multiple-Assignment Unpacking over Indexing
+    EFP213 = sys.intern("EFP213")  # Context-Aware String Concatenation
+    EFP318 = sys.intern("EFP318")  # Parallel Iteration with zip()
+    EFP320 = sys.intern("EFP320")  # Loop Variables After Loop Ends
+    EFP321 = sys.intern("EFP321")  # Be Defensive when Iterating over Arguments
+    EFP426 = sys.intern("EFP426")  # Comprehensive dict.get() patterns
 
     # Future rules (for preparation)
-    HP001 = "HP001"  # String concatenation in loops (future)
-    PC001 = "PC001"  # List membership testing (future)
+    HP001 = sys.intern("HP001")  # String concatenation in loops (future)
+    PC001 = sys.intern("PC001")  # List membership testing (future)
+
+
+# C-level accessor for the message column of an error tuple; map() over it
+# stays out of the bytecode loop entirely.
+_get_message = itemgetter(2)
+
+
+def _error_code_tokens(errors):
+    """Extract the leading error-code token from each message."""
+    return {message.split(None, 1)[0] for message in map(_get_message, errors)}
+
+
+def extract_error_codes(errors) -> set[str]:
+    """Build the set of error codes present in a result list.
+
+    Tests checking several codes against the same errors should call
+    this once and use membership, rather than substring-scanning every
+    message per code.
+    """
+    return _error_code_tokens(errors)
+
+
+def _matches_code(codes, code):
+    """Check a code (or code prefix like "EFP") against a token set."""
+    return code in codes or any(token.startswith(code) for token in codes)
 
 
 def assert_error_code(errors, expected_code):
     """Helper to assert that a specific error code is present."""
-    error_codes = [error[2] for error in errors]
-    found_codes = [code for code in error_codes if expected_code in code]
-    assert found_codes, f"Expected {expected_code} not found in {error_codes}"
+    codes = _error_code_tokens(errors)
+    assert _matches_code(
+        codes, expected_code
+    ), f"Expected {expected_code} not found in {sorted(codes)}"
 
 
 def assert_no_errors(errors):
     """Helper to assert that no errors were found."""
-    assert not errors, f"Expected no errors but found: {[error[2] for error in errors]}"
+    assert (
+        not errors
+    ), f"Expected no errors but found: {list(map(_get_message, errors))}"
 
 
 def assert_no_error_code(errors, unwanted_code):
     """Helper to assert that a specific error code is NOT present."""
-    error_codes = [error[2] for error in errors]
-    found_codes = [code for code in error_codes if unwanted_code in code]
-    assert not found_codes, f"Unwanted {unwanted_code} found in {error_codes}"
+    codes = _error_code_tokens(errors)
+    assert not _matches_code(
+        codes, unwanted_code
+    ), f"Unwanted {unwanted_code} found in {sorted(codes)}"
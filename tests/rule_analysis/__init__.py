@@ -9,6 +9,7 @@ flake8).
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 
 class LinterName(Enum):
@@ -20,7 +21,7 @@ class LinterName(Enum):
     FLAKE8 = "flake8"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CodeSample:
     """Represents a code sample for testing against linters."""
 
@@ -31,7 +32,7 @@ class CodeSample:
     category: str  # e.g., "positive", "negative", "edge_case"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LinterViolation:
     """Represents a violation found by a linter."""
 
@@ -43,7 +44,7 @@ class LinterViolation:
     severity: str  # Severity level (error, warning, info)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LinterResults:
     """Results from running linters against a code sample."""
 
@@ -52,7 +53,7 @@ class LinterResults:
     execution_errors: dict[str, str]  # Linter name -> error message
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RedundancyAnalysis:
     """Analysis of redundancy between our rule and existing linters."""
 
@@ -85,6 +86,16 @@ class Severity:
     INFO = "info"
 
 
+@lru_cache(maxsize=1024)
+def _normalize(code: str) -> str:
+    """Normalize sample source (strip + trailing newline), memoized.
+
+    Table-driven analyses reuse the same snippets; identical inputs get
+    the same normalized string object back instead of a fresh copy.
+    """
+    return code.strip() + "\n"
+
+
 def create_code_sample(
     name: str,
     code: str,
@@ -103,7 +114,7 @@ def create_code_sample(
 
     return CodeSample(
         name=name,
-        code=code.strip() + "\n",  # Ensure proper newline ending
+        code=_normalize(code),  # Ensure proper newline ending
         should_trigger=should_trigger,
         description=description,
         category=category,
@@ -14,6 +14,7 @@ import argparse
 import json
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Handle imports gracefully
@@ -24,24 +25,28 @@ except (ImportError, ValueError):
     from report_generator import analyze_linter_output, generate_report
 
 
+# Base argv per linter, built once at import; run_linter appends the file
+_LINTER_COMMANDS: dict[str, tuple[str, ...]] = {
+    "ruff": ("ruff", "check", "--output-format=json"),
+    "pylint": ("pylint", "--output-format=json", "--reports=n"),
+    "flake8-bugbear": ("flake8", "--select=B", "--format=json"),
+    "flake8": ("flake8", "--format=json"),
+}
+
+
 def run_linter(linter_name: str, file_path: Path) -> dict:
     """Run a single linter on a file and return parsed results."""
 
-    commands = {
-        "ruff": ["ruff", "check", "--output-format=json", str(file_path)],
-        "pylint": ["pylint", "--output-format=json", "--reports=n", str(file_path)],
-        "flake8-bugbear": ["flake8", "--select=B", "--format=json", str(file_path)],
-        "flake8": ["flake8", "--format=json", str(file_path)],
-    }
-
-    if linter_name not in commands:
+    command = _LINTER_COMMANDS.get(linter_name)
+    if command is None:
         return {"error": f"Unknown linter: {linter_name}"}
 
     try:
+        # Bytes mode: JSON output goes straight to the parser without a
+        # Python-level decode pass over potentially large linter output.
         result = subprocess.run(
-            commands[linter_name],
+            (*command, str(file_path)),
             capture_output=True,
-            text=True,
             timeout=30,
             check=False,  # Don't raise on lint violations
         )
@@ -49,7 +54,7 @@ def run_linter(linter_name: str, file_path: Path) -> dict:
         return {
             "linter": linter_name,
             "stdout": result.stdout,
-            "stderr": result.stderr,
+            "stderr": result.stderr.decode("utf-8", "replace"),
             "returncode": result.returncode,
         }
 
@@ -62,22 +67,181 @@ def run_linter(linter_name: str, file_path: Path) -> dict:
 
 
 def run_all_linters(file_path: Path, linters: list[str]) -> dict[str, dict]:
-    """Run multiple linters on a file."""
+    """Run multiple linters on a file concurrently.
+
+    Each linter is an independent external process, so wall time is the
+    slowest linter rather than the sum (subprocess.run releases the GIL).
+    """
     results = {}
 
-    for linter in linters:
-        print(f"Running {linter}...", end=" ", flush=True)
-        result = run_linter(linter, file_path)
-        results[linter] = result
+    with ThreadPoolExecutor(max_workers=len(linters)) as executor:
+        futures = {
+            executor.submit(run_linter, linter, file_path): linter for linter in linters
+        }
+        for future in as_completed(futures):
+            linter = futures[future]
+            result = future.result()
+            results[linter] = result
+
+            if "error" in result:
+                print(f"{linter}: ❌ {result['error']}")
+            else:
+                print(f"{linter}: ✓")
 
-        if "error" in result:
-            print(f"❌ {result['error']}")
-        else:
-            print("✓")
+    return results
+
+
+def run_all_linters_batch(
+    file_paths: list[Path], linters: list[str]
+) -> dict[Path, dict[str, dict]]:
+    """Run each linter once over every file and demultiplex the output.
+
+    Linter startup (interpreter boot, plugin loading) dominates per-file
+    cost, so one invocation per linter amortizes it across the whole
+    analysis set. Results are re-packed into the same per-file shape
+    run_linter produces so the report pipeline is unchanged.
+    """
+    results: dict[Path, dict[str, dict]] = {path: {} for path in file_paths}
+
+    with ThreadPoolExecutor(max_workers=len(linters)) as executor:
+        futures = {
+            executor.submit(_run_linter_batch, linter, file_paths): linter
+            for linter in linters
+        }
+        for future in as_completed(futures):
+            linter = futures[future]
+            per_file = future.result()
+            for path in file_paths:
+                entry = per_file.get(path)
+                if entry is None:
+                    # Fresh dict per file: a shared default would alias
+                    # any downstream mutation across files.
+                    entry = {
+                        "linter": linter,
+                        "stdout": b"",
+                        "stderr": "",
+                        "returncode": 0,
+                    }
+                results[path][linter] = entry
+
+            errors = [r for r in per_file.values() if "error" in r]
+            if errors:
+                print(f"{linter}: ❌ {errors[0]['error']}")
+            else:
+                print(f"{linter}: ✓")
 
     return results
 
 
+def _error_for_all(file_paths: list[Path], message: str) -> dict[Path, dict]:
+    """Fan an error out to every file, one fresh dict per file.
+
+    dict.fromkeys would share a single mutable dict across all files.
+    """
+    return {path: {"error": message} for path in file_paths}
+
+
+def _run_linter_batch(linter_name: str, file_paths: list[Path]) -> dict[Path, dict]:
+    """Run one linter over many files and split its output per file."""
+    command = _LINTER_COMMANDS.get(linter_name)
+    if command is None:
+        return _error_for_all(file_paths, f"Unknown linter: {linter_name}")
+
+    try:
+        result = subprocess.run(
+            (*command, *map(str, file_paths)),
+            capture_output=True,
+            timeout=30 * len(file_paths),
+            check=False,
+        )
+    except subprocess.TimeoutExpired:
+        return _error_for_all(file_paths, f"{linter_name} timed out")
+    except FileNotFoundError:
+        return _error_for_all(
+            file_paths, f"{linter_name} not found - please install it"
+        )
+    except Exception as e:
+        return _error_for_all(file_paths, f"{linter_name} failed: {e}")
+
+    stderr = result.stderr.decode("utf-8", "replace")
+    buckets = _split_stdout_by_file(linter_name, result.stdout, file_paths)
+    return {
+        path: {
+            "linter": linter_name,
+            "stdout": buckets.get(path, b""),
+            "stderr": stderr,
+            "returncode": result.returncode,
+        }
+        for path in file_paths
+    }
+
+
+def _split_stdout_by_file(
+    linter_name: str, stdout: bytes, file_paths: list[Path]
+) -> dict[Path, bytes]:
+    """Bucket combined linter JSON output by source file.
+
+    ruff items carry "filename", pylint items carry "path", and flake8's
+    JSON format is already a mapping keyed by filename. Each bucket is
+    re-encoded so parse_linter_violations sees single-file output.
+    """
+    if not stdout.strip():
+        return {}
+
+    by_name = {str(path): path for path in file_paths}
+    by_name.update({str(path.resolve()): path for path in file_paths})
+
+    try:
+        data = json.loads(stdout)
+    except ValueError:
+        # Text output (flake8 fallback): group lines by path prefix
+        text_buckets: dict[Path, list[str]] = {}
+        for line in stdout.decode("utf-8", "replace").splitlines():
+            for name, path in by_name.items():
+                if line.startswith(name):
+                    text_buckets.setdefault(path, []).append(line)
+                    break
+        return {path: "\n".join(lines).encode() for path, lines in text_buckets.items()}
+
+    buckets: dict[Path, list | dict] = {}
+    if isinstance(data, dict):
+        # flake8 --format=json: {filename: [violations]}
+        for name, items in data.items():
+            path = by_name.get(name)
+            if path is not None:
+                buckets.setdefault(path, {})[name] = items  # type: ignore[index]
+    else:
+        key = "path" if linter_name == "pylint" else "filename"
+        for item in data:
+            path = by_name.get(item.get(key, ""))
+            if path is not None:
+                buckets.setdefault(path, []).append(item)  # type: ignore[union-attr]
+
+    return {path: json.dumps(items).encode() for path, items in buckets.items()}
+
+
+def analyze_all(linters: list[str], output: str, *, verbose: bool = False) -> int:
+    """Analyze every *_analysis.py file with one linter invocation each."""
+    analysis_files = sorted(Path(__file__).parent.glob("*_analysis.py"))
+    if not analysis_files:
+        print("Error: No analysis files found")
+        return 1
+
+    batch_results = run_all_linters_batch(analysis_files, linters)
+    print()
+
+    for analysis_file in analysis_files:
+        rule_code = analysis_file.stem.replace("_analysis", "").upper()
+        analysis = analyze_linter_output(rule_code, batch_results[analysis_file])
+        if output == "json":
+            print(json.dumps(analysis, indent=2))
+        else:
+            detailed = batch_results[analysis_file] if verbose else None
+            print(generate_report(analysis, detailed))
+
+    return 0
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Analyze rule redundancy with existing linters",
@@ -90,7 +254,9 @@ Examples:
         """.strip(),
     )
 
-    parser.add_argument("rule_code", help="Rule code (e.g., efp105)")
+    parser.add_argument(
+        "rule_code", help="Rule code (e.g., efp105), or 'all' for every rule"
+    )
     parser.add_argument(
         "--linters",
         default="ruff,pylint,flake8-bugbear,flake8",
@@ -103,6 +269,11 @@ Examples:
 
     args = parser.parse_args()
 
+    linters = [linter.strip() for linter in args.linters.split(",") if linter.strip()]
+
+    if args.rule_code.lower() == "all":
+        return analyze_all(linters, args.output, verbose=args.verbose)
+
     # Find the analysis file
     analysis_file = Path(__file__).parent / f"{args.rule_code.lower()}_analysis.py"
     if not analysis_file.exists():
@@ -113,9 +284,6 @@ Examples:
             print(f"Available rules: {', '.join(rules)}")
         return 1
 
-    # Parse linters
-    linters = [linter.strip() for linter in args.linters.split(",") if linter.strip()]
-
     if args.verbose:
         print(f"Analyzing {args.rule_code.upper()} redundancy...")
         print(f"File: {analysis_file}")
@@ -5,109 +5,158 @@ This module analyzes linter output to determine if existing linters
 detect the same patterns our rules target.
 """
 
+import io
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+# orjson parses JSON 2-5x faster and accepts bytes directly; fall back to
+# the stdlib when it is not installed (it is not a declared dependency).
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+class Violation(NamedTuple):
+    """One linter violation; field access is a C-level slot read.
+
+    A 3-key dict per record paid hash-table storage and BINARY_SUBSCR
+    lookups downstream; the tuple is a third the size and serializes to
+    JSON as [rule_code, line, message].
+    """
+
+    rule_code: str
+    line: int
+    message: str
+
 
 # Known formatting/style violations that don't indicate pattern detection
-FORMATTING_VIOLATIONS = {
-    # File structure
-    "INP001",  # Missing __init__.py
-    "ANN201",  # Missing return type annotation
-    "ANN001",  # Missing type annotation
-    # Documentation
-    "D100",
-    "D101",
-    "D102",
-    "D103",
-    "D104",
-    "D105",
-    "D106",
-    "D107",
-    # Style/formatting
-    "W292",
-    "W293",
-    "C0304",
-    "C0305",  # Newlines
-    "E302",
-    "E303",
-    "E501",  # Spacing/length
-    "COM812",
-    "COM819",  # Commas
-    "Q000",
-    "Q001",
-    "Q002",
-    "Q003",  # Quotes
-    "I001",
-    "I002",  # Imports
-    # Unused/naming
-    "F401",
-    "F811",
-    "F841",  # Unused
-    "C0103",
-    "C0114",
-    "C0115",
-    "C0116",  # Naming/docs
-    "W0611",
-    "W0613",
-    "W0622",  # Unused/redefining
-    # Design (not patterns)  # noqa: ERA001
-    "R0903",
-    "R0913",
-    "R0914",  # Too few/many
-}
+FORMATTING_VIOLATIONS: frozenset[str] = frozenset(
+    {
+        # File structure
+        "INP001",  # Missing __init__.py
+        "ANN201",  # Missing return type annotation
+        "ANN001",  # Missing type annotation
+        # Documentation
+        "D100",
+        "D101",
+        "D102",
+        "D103",
+        "D104",
+        "D105",
+        "D106",
+        "D107",
+        # Style/formatting
+        "W292",
+        "W293",
+        "C0304",
+        "C0305",  # Newlines
+        "E302",
+        "E303",
+        "E501",  # Spacing/length
+        "COM812",
+        "COM819",  # Commas
+        "Q000",
+        "Q001",
+        "Q002",
+        "Q003",  # Quotes
+        "I001",
+        "I002",  # Imports
+        # Unused/naming
+        "F401",
+        "F811",
+        "F841",  # Unused
+        "C0103",
+        "C0114",
+        "C0115",
+        "C0116",  # Naming/docs
+        "W0611",
+        "W0613",
+        "W0622",  # Unused/redefining
+        # Design (not patterns)  # noqa: ERA001
+        "R0903",
+        "R0913",
+        "R0914",  # Too few/many
+    }
+)
 
 # Pattern detection rules that ARE relevant
-PATTERN_RULES = {
-    # flake8-bugbear patterns
-    "B006",
-    "B007",
-    "B008",
-    "B011",
-    "B015",
-    "B018",
-    "B023",
-    # Pylint patterns
-    "R1701",
-    "R1703",
-    "R1705",
-    "R1712",
-    "R1713",
-    "R1715",
-    "R1726",
-    "W0102",
-    "W0104",
-    "W0120",
-    # Ruff patterns
-    "PERF",
-    "SIM",
-    "UP",
-    "PIE",
-    "C4",
-}
-
-
-def is_pattern_violation(rule_code: str) -> bool:
-    """Check if a rule code represents actual pattern detection."""
-    # Direct formatting violation
-    if rule_code in FORMATTING_VIOLATIONS:
-        return False
+PATTERN_RULES: frozenset[str] = frozenset(
+    {
+        # flake8-bugbear patterns
+        "B006",
+        "B007",
+        "B008",
+        "B011",
+        "B015",
+        "B018",
+        "B023",
+        # Pylint patterns
+        "R1701",
+        "R1703",
+        "R1705",
+        "R1712",
+        "R1713",
+        "R1715",
+        "R1726",
+        "W0102",
+        "W0104",
+        "W0120",
+        # Ruff patterns
+        "PERF",
+        "SIM",
+        "UP",
+        "PIE",
+        "C4",
+    }
+)
+
+# Prefixes of pattern-detection rule families; str.startswith accepts the
+# tuple directly, so one C-level call replaces the per-prefix generator.
+PATTERN_PREFIXES: tuple[str, ...] = ("PERF", "SIM", "UP", "PIE", "C4", "B0")
 
-    # Known pattern detection rule
-    if rule_code in PATTERN_RULES:
-        return True
+# Shared read-only default for .get() fallbacks; an inline {} would
+# allocate a fresh dict per violation row.
+_EMPTY_DICT: dict = {}
 
-    # Pattern rule prefixes
-    if any(
-        rule_code.startswith(prefix)
-        for prefix in ["PERF", "SIM", "UP", "PIE", "C4", "B0"]
-    ):
-        return True
+# flake8 text lines look like "path:line:col: CODE message"; one
+# precompiled pattern run over the whole buffer replaces per-line
+# split/strip/int bookkeeping in the text fallback.
+_FLAKE8_TEXT_RE = re.compile(r"^[^:\n]+:(\d+):\d+:\s*(\S+)\s+(.*)$", re.MULTILINE)
 
-    # Pylint R-rules (refactoring suggestions)
-    return rule_code.startswith("R1") and rule_code not in FORMATTING_VIOLATIONS
+# Report layout rules, built once instead of re-multiplied per call
+_BAR = "=" * 60
+_HR_SHORT = "-" * 20
+_HR_MED = "-" * 25
+_HR_LONG = "-" * 35
+_HR_HEAD = "-" * 40
 
 
-def parse_linter_violations(linter_name: str, stdout: str, _stderr: str) -> list[dict]:
-    """Parse violations from linter output."""
+def is_pattern_violation(rule_code: str, /) -> bool:
+    """Check if a rule code represents actual pattern detection.
+
+    Called once per violation, so the body is a single short-circuit
+    chain of C-level set membership and startswith checks: known
+    formatting codes are excluded first, then known pattern rules,
+    pattern-family prefixes, and pylint R1 refactoring codes.
+    """
+    if rule_code in FORMATTING_VIOLATIONS:
+        return False
+    return (
+        rule_code in PATTERN_RULES
+        or rule_code.startswith(PATTERN_PREFIXES)
+        or rule_code.startswith("R1")
+    )
+
+
+def parse_linter_violations(
+    linter_name: str, stdout: bytes | str, _stderr: str
+) -> list[Violation]:
+    """Parse violations from linter output (bytes or text)."""
     violations = []
 
     if not stdout.strip():
@@ -116,63 +165,53 @@ def parse_linter_violations(linter_name: str, stdout: str, _stderr: str) -> list
     if linter_name in ["ruff", "pylint"]:
         try:
             # JSON format
-            data = json.loads(stdout)
+            data = _json_loads(stdout)
 
             if linter_name == "ruff":
-                for item in data:
-                    violations.append(
-                        {
-                            "rule_code": item.get("code", "UNKNOWN"),
-                            "line": item.get("location", {}).get("row", 0),
-                            "message": item.get("message", ""),
-                        }
+                violations = [
+                    Violation(
+                        item.get("code", "UNKNOWN"),
+                        item.get("location", _EMPTY_DICT).get("row", 0),
+                        item.get("message", ""),
                     )
+                    for item in data
+                ]
 
             elif linter_name == "pylint":
-                for item in data:
-                    violations.append(
-                        {
-                            "rule_code": item.get("message-id", "UNKNOWN"),
-                            "line": item.get("line", 0),
-                            "message": item.get("message", ""),
-                        }
+                violations = [
+                    Violation(
+                        item.get("message-id", "UNKNOWN"),
+                        item.get("line", 0),
+                        item.get("message", ""),
                     )
-        except json.JSONDecodeError:
+                    for item in data
+                ]
+        except ValueError:
             pass  # No violations or unparseable output
 
     elif linter_name in ["flake8", "flake8-bugbear"]:
         # Try JSON first, fallback to text
         try:
-            data = json.loads(stdout)
-            for file_violations in data.values():
-                for item in file_violations:
-                    violations.append(
-                        {
-                            "rule_code": item.get("code", "UNKNOWN"),
-                            "line": item.get("line_number", 0),
-                            "message": item.get("text", ""),
-                        }
-                    )
-        except json.JSONDecodeError:
-            # Fallback to text parsing
-            for line in stdout.strip().split("\n"):
-                if ":" in line:
-                    parts = line.split(":", 3)
-                    if len(parts) >= 4:
-                        try:
-                            line_num = int(parts[1])
-                            code_msg = parts[3].strip()
-                            if " " in code_msg:
-                                code, message = code_msg.split(" ", 1)
-                                violations.append(
-                                    {
-                                        "rule_code": code,
-                                        "line": line_num,
-                                        "message": message,
-                                    }
-                                )
-                        except (ValueError, IndexError):
-                            continue
+            data = _json_loads(stdout)
+            violations = [
+                Violation(
+                    item.get("code", "UNKNOWN"),
+                    item.get("line_number", 0),
+                    item.get("text", ""),
+                )
+                for file_violations in data.values()
+                for item in file_violations
+            ]
+        except ValueError:
+            # Fallback to text parsing (only this path needs a decode)
+            if isinstance(stdout, bytes):
+                text = stdout.decode("utf-8", "replace")
+            else:
+                text = stdout
+            violations = [
+                Violation(match.group(2), int(match.group(1)), match.group(3))
+                for match in _FLAKE8_TEXT_RE.finditer(text)
+            ]
 
     return violations
 
@@ -186,25 +225,55 @@ def analyze_linter_output(rule_code: str, linter_results: dict[str, dict]) -> di
 
     all_violations = {}
 
+    # Parse phase first, spread over a thread pool: the JSON scanner and
+    # regex matcher do their work in C, so large outputs from several
+    # linters decode concurrently. Aggregation stays sequential below.
+    parseable = {
+        name: result for name, result in linter_results.items() if "error" not in result
+    }
+    if len(parseable) > 1:
+        with ThreadPoolExecutor(max_workers=len(parseable)) as executor:
+            parsed = dict(
+                zip(
+                    parseable,
+                    executor.map(
+                        lambda item: parse_linter_violations(
+                            item[0], item[1]["stdout"], item[1]["stderr"]
+                        ),
+                        parseable.items(),
+                    ),
+                    strict=True,
+                )
+            )
+    else:
+        parsed = {
+            name: parse_linter_violations(name, result["stdout"], result["stderr"])
+            for name, result in parseable.items()
+        }
+
+    # Local binding for the per-violation filter: LOAD_FAST instead of
+    # LOAD_GLOBAL on every record.
+    _is_pattern = is_pattern_violation
+
     for linter_name, result in linter_results.items():
         if "error" in result:
             all_violations[linter_name] = {"error": result["error"]}
             continue
 
-        violations = parse_linter_violations(
-            linter_name, result["stdout"], result["stderr"]
-        )
-
-        linter_pattern_violations = []
-
-        for violation in violations:
-            total_violations += 1
-
-            if is_pattern_violation(violation["rule_code"]):
-                pattern_violations += 1
-                linters_with_patterns.add(linter_name)
-                pattern_rules_found.add(violation["rule_code"])
-                linter_pattern_violations.append(violation)
+        violations = parsed[linter_name]
+
+        # One comprehension pass classifies the batch; counters and set
+        # updates then run per linter instead of per violation.
+        linter_pattern_violations = [
+            violation for violation in violations if _is_pattern(violation.rule_code)
+        ]
+        total_violations += len(violations)
+        pattern_violations += len(linter_pattern_violations)
+        if linter_pattern_violations:
+            linters_with_patterns.add(linter_name)
+            pattern_rules_found.update(
+                violation.rule_code for violation in linter_pattern_violations
+            )
 
         all_violations[linter_name] = {
             "total_violations": len(violations),
@@ -215,7 +284,8 @@ def analyze_linter_output(rule_code: str, linter_results: dict[str, dict]) -> di
     # Calculate redundancy
     redundancy_percentage = 0.0
     if total_violations > 0:
-        redundancy_percentage = (pattern_violations / max(1, total_violations)) * 100
+        # The guard above already rules out zero; no max() clamp needed.
+        redundancy_percentage = pattern_violations / total_violations * 100
 
     # Determine recommendation
     if pattern_violations == 0:
@@ -247,80 +317,73 @@ def analyze_linter_output(rule_code: str, linter_results: dict[str, dict]) -> di
 
 
 def generate_report(analysis: dict, detailed_results: dict | None = None) -> str:
-    """Generate a formatted report."""
-    lines = [
-        "=" * 60,
-        f"REDUNDANCY ANALYSIS: {analysis['rule_code']}",
-        "=" * 60,
-        "",
-        "📊 SUMMARY",
-        "-" * 20,
-        f"Total violations found: {analysis['total_violations']}",
-        f"Pattern-related violations: {analysis['pattern_violations']}",
-        f"Redundancy indicator: {analysis['redundancy_percentage']:.1f}%",
-        "",
-        "💡 RECOMMENDATION",
-        "-" * 20,
-        analysis["recommendation"],
-        "",
-    ]
+    """Generate a formatted report.
+
+    Fixed-layout sections are written as single multi-line strings into a
+    StringIO buffer; repeated rows go through one join each. This avoids
+    growing (and re-growing) an intermediate list of every output line
+    before a final join.
+    """
+    buf = io.StringIO()
+    write = buf.write
+
+    write(
+        f"{_BAR}\n"
+        f"REDUNDANCY ANALYSIS: {analysis['rule_code']}\n"
+        f"{_BAR}\n"
+        "\n"
+        "📊 SUMMARY\n"
+        f"{_HR_SHORT}\n"
+        f"Total violations found: {analysis['total_violations']}\n"
+        f"Pattern-related violations: {analysis['pattern_violations']}\n"
+        f"Redundancy indicator: {analysis['redundancy_percentage']:.1f}%\n"
+        "\n"
+        "💡 RECOMMENDATION\n"
+        f"{_HR_SHORT}\n"
+        f"{analysis['recommendation']}\n"
+        "\n"
+    )
 
     if analysis["linters_with_patterns"]:
-        lines.extend(
-            [
-                "🔍 LINTERS WITH PATTERN DETECTION",
-                "-" * 35,
-            ]
+        write(f"🔍 LINTERS WITH PATTERN DETECTION\n{_HR_LONG}\n")
+        write(
+            "\n".join(f"  • {linter}" for linter in analysis["linters_with_patterns"])
         )
-        for linter in analysis["linters_with_patterns"]:
-            lines.append(f"  • {linter}")
-        lines.append("")
+        write("\n\n")
 
     if analysis["pattern_rules_found"]:
-        lines.extend(
-            [
-                "📋 PATTERN RULES DETECTED",
-                "-" * 25,
-            ]
-        )
-        for rule in analysis["pattern_rules_found"]:
-            lines.append(f"  • {rule}")
-        lines.append("")
+        write(f"📋 PATTERN RULES DETECTED\n{_HR_MED}\n")
+        write("\n".join(f"  • {rule}" for rule in analysis["pattern_rules_found"]))
+        write("\n\n")
 
     if detailed_results:
-        lines.extend(
-            [
-                "=" * 60,
-                "DETAILED RESULTS",
-                "=" * 60,
-                "",
-            ]
-        )
+        write(f"{_BAR}\nDETAILED RESULTS\n{_BAR}\n\n")
 
         for linter, result in detailed_results.items():
-            lines.append(f"📝 {linter.upper()}")
-            lines.append("-" * 40)
+            write(f"📝 {linter.upper()}\n{_HR_HEAD}\n")
 
             if "error" in result:
-                lines.append(f"❌ Error: {result['error']}")
+                write(f"❌ Error: {result['error']}\n")
             else:
                 linter_result = analysis["detailed_results"][linter]
                 total = linter_result["total_violations"]
                 patterns = len(linter_result["pattern_violations"])
 
-                lines.append(f"Total violations: {total}")
-                lines.append(f"Pattern violations: {patterns}")
+                write(f"Total violations: {total}\nPattern violations: {patterns}\n")
 
                 if linter_result["pattern_violations"]:
-                    lines.append("Pattern violations found:")
-                    for v in linter_result["pattern_violations"]:
-                        lines.append(
-                            f"  {v['rule_code']} (line {v['line']}): " f"{v['message']}"
+                    write("Pattern violations found:\n")
+                    write(
+                        "\n".join(
+                            f"  {v.rule_code} (line {v.line}): {v.message}"
+                            for v in linter_result["pattern_violations"]
                         )
+                    )
+                    write("\n")
                 else:
-                    lines.append("✅ No pattern violations")
+                    write("✅ No pattern violations\n")
 
-            lines.append("")
+            write("\n")
 
-    lines.append("=" * 60)
-    return "\n".join(lines)
+    write(_BAR)
+    return buf.getvalue()
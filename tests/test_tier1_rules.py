@@ -11,7 +11,12 @@ in existing Python linting tools:
 - EFP426: Comprehensive dict.get() patterns
 """
 
-from .conftest import ErrorCodes, assert_error_code, assert_no_error_code
+from .conftest import (
+    ErrorCodes,
+    assert_error_code,
+    assert_no_error_code,
+    extract_error_codes,
+)
 
 
 class TestEFP105MultipleAssignmentUnpacking:
@@ -61,6 +66,18 @@ x = item[0]     # Single access - should not trigger EFP105
         errors = run_checker(code)
         assert_no_error_code(errors, ErrorCodes.EFP105)
 
+    def test_match_case_body_pattern(self, run_checker):
+        """Should detect sequential indexing inside a match case body."""
+        code = """
+match point:
+    case [x, y]:
+        a = point[0]    # Sequential indexing
+        b = point[1]    # Should trigger EFP105
+        print(a, b)
+"""
+        errors = run_checker(code)
+        assert_error_code(errors, ErrorCodes.EFP105)
+
 
 class TestEFP213ContextAwareStringConcatenation:
     """Test EFP213: Context-Aware String Concatenation.
@@ -354,10 +371,13 @@ class TestTier1Integration:
             ErrorCodes.EFP426,
         ]
 
-        error_messages = [error[2] for error in errors]
+        # One pass over the messages builds the code set; each expected
+        # code is then a hash lookup instead of a substring scan.
+        found_codes = extract_error_codes(errors)
         for expected_code in expected_codes:
-            found = any(expected_code in msg for msg in error_messages)
-            assert found, f"Expected {expected_code} not found in comprehensive test"
+            assert (
+                expected_code in found_codes
+            ), f"Expected {expected_code} not found in comprehensive test"
 
     def test_comprehensive_good_code_clean(self, run_checker, comprehensive_good_code):
         """Should not flag any Tier 1 violations in good code."""
@@ -373,10 +393,11 @@ class TestTier1Integration:
             ErrorCodes.EFP426,
         ]
 
-        error_messages = [error[2] for error in errors]
+        found_codes = extract_error_codes(errors)
         for code in tier1_codes:
-            found = any(code in msg for msg in error_messages)
-            assert not found, f"Unexpected {code} found in good code: {error_messages}"
+            assert (
+                code not in found_codes
+            ), f"Unexpected {code} found in good code: {sorted(found_codes)}"
 
     def test_no_false_positives_on_standard_patterns(self, run_checker):
         """Should not flag common standard Python patterns."""